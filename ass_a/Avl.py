@@ -3,8 +3,10 @@ class AvlNode:
     # @brief This function initializes the class object
     # @param[in] key Key of the node
     # @param[in] value Value of the node
-    def __init__(self, key, value):
+    # @param[in] sort_key Key used for comparisons (computed once per node)
+    def __init__(self, key, value, sort_key):
         self.key = key
+        self.sort_key = sort_key
         self.value = value
         self.left = None
         self.right = None
@@ -13,8 +15,19 @@ class AvlNode:
 # @brief This class manages provides an Dictionary ADT using AVL Trees
 class AvlTree:
     # @brief This function initializes the class object
-    def __init__(self):
+    # @param[in] key Function mapping a key to the key used for comparisons
+    #            (None to compare the keys themselves)
+    def __init__(self, key=None):
         self.__root = None
+        self.__key = key
+
+    # @brief This function computes the key used for comparisons
+    # @param[in] key Key of the node or the key being searched for
+    # @retval Key used for comparisons
+    def __sort_key(self, key):
+        if self.__key is None:
+            return key
+        return self.__key(key)
 
     # @brief Given a node object this function returns the height of that node
     # @param[in] node Node whose height is to be returned
@@ -103,18 +116,19 @@ class AvlTree:
     # @brief This function recursively inserts a key value pair in the tree
     # @param[in] root Node pointer or object
     # @param[in] key Key to be inserted
+    # @param[in] sort_key Key used for comparisons
     # @param[in] value Value to be inserted
     # @retval Node pointer or object
-    def __insert_recursive(self, root, key, value):
+    def __insert_recursive(self, root, key, sort_key, value):
         # Check if root is null
         if not root:
-            return AvlNode(key, value)
+            return AvlNode(key, value, sort_key)
         # If key is less than current key
-        elif key < root.key:
-            root.left = self.__insert_recursive(root.left, key, value)
+        elif sort_key < root.sort_key:
+            root.left = self.__insert_recursive(root.left, key, sort_key, value)
         # If key is greater than current key
         else:
-            root.right = self.__insert_recursive(root.right, key, value)
+            root.right = self.__insert_recursive(root.right, key, sort_key, value)
 
         # Balance and return the node
         return self.__balance_node(root)
@@ -123,25 +137,25 @@ class AvlTree:
     # @param[in] key Key to be inserted
     # @param[in] value Value to be inserted
     def insert(self, key, value):
-        self.__root = self.__insert_recursive(self.__root, key, value)
+        self.__root = self.__insert_recursive(self.__root, key, self.__sort_key(key), value)
 
     # @brief The function recursively finds for a key and updates
     #        its values field by the specified value
     # @param[in] root Node pointer or object
-    # @param[in] key Key to be searched for
+    # @param[in] sort_key Key used for comparisons
     # @param[in] value Value to be updated with
     # @retval True If key found and updated
     # @retval False If key not found
-    def __update_recursive(self, root, key, value):
+    def __update_recursive(self, root, sort_key, value):
         # If root is None then return false
         if not root:
             return False
         # If key is less than current key
-        elif key < root.key:
-            return self.__update_recursive(root.left, key, value)
+        elif sort_key < root.sort_key:
+            return self.__update_recursive(root.left, sort_key, value)
         # If key is greater than current key
-        elif key > root.key:
-            return self.__update_recursive(root.right, key, value)
+        elif sort_key > root.sort_key:
+            return self.__update_recursive(root.right, sort_key, value)
         # If key found
         else:
             # Update the current node
@@ -153,22 +167,22 @@ class AvlTree:
     # @param[in] key Key to be searched for
     # @param[in] value Value to be updated with
     def update(self, key, value):
-        return self.__update_recursive(self.__root, key, value)
+        return self.__update_recursive(self.__root, self.__sort_key(key), value)
 
     # @brief This function deleted a node recursively from the tree
     # @param[in] root Node object or pointer to be deleted
-    # @param[in] key Key to be deleted
+    # @param[in] sort_key Key used for comparisons
     # @retval Node pointer or object
-    def __delete_recursive(self, root, key):
+    def __delete_recursive(self, root, sort_key):
         # If root is None then return false
         if not root:
             return None
         # If key is less than current key
-        elif key < root.key:
-            root.left = self.__delete_recursive(root.left, key)
+        elif sort_key < root.sort_key:
+            root.left = self.__delete_recursive(root.left, sort_key)
         # If key is greater than current key
-        elif key > root.key:
-            root.right = self.__delete_recursive(root.right, key)
+        elif sort_key > root.sort_key:
+            root.right = self.__delete_recursive(root.right, sort_key)
         # If key found
         else:
             # If root has not child
@@ -194,17 +208,18 @@ class AvlTree:
 
                 # Move the successor to the current node
                 root.key = successor.key
+                root.sort_key = successor.sort_key
                 root.value = successor.value
 
                 # Delete the successor node
-                root.right = self.__delete_recursive(root.right, successor.key)
+                root.right = self.__delete_recursive(root.right, successor.sort_key)
 
         return self.__balance_node(root)
 
     # @brief The function available to the user to delete a node from the tree
     # @param[in] key Key to be deleted from the tree
     def delete(self, key):
-        self.__root = self.__delete_recursive(self.__root, key)
+        self.__root = self.__delete_recursive(self.__root, self.__sort_key(key))
 
     # @brief This function performs an ascending traversal of the tree
     #        printing the key value pair while traversing
@@ -250,18 +265,18 @@ class AvlTree:
 
     # @brief This function recursively searches for a key in a tree
     # @param[in] root Node object or pointer
-    # @param[in] key Key to be searched formed
+    # @param[in] sort_key Key used for comparisons
     # @retval Returns the value corresponding to the key or None
-    def __search_recursive(self, root, key):
+    def __search_recursive(self, root, sort_key):
         # If root is None then return false
         if not root:
             return None
         # If key is less than current key
-        elif key < root.key:
-            return self.__search_recursive(root.left, key)
+        elif sort_key < root.sort_key:
+            return self.__search_recursive(root.left, sort_key)
         # If key is greater than current key
-        elif key > root.key:
-            return self.__search_recursive(root.right, key)
+        elif sort_key > root.sort_key:
+            return self.__search_recursive(root.right, sort_key)
         # If key found
         else:
             return root.value
@@ -269,4 +284,4 @@ class AvlTree:
     # @brief The function available to the user to search for key's value
     # @param[in] key Key to be searched formed
     def search(self, key):
-        return self.__search_recursive(self.__root, key)
+        return self.__search_recursive(self.__root, self.__sort_key(key))
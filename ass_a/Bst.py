@@ -3,8 +3,10 @@ class BstNode:
     # @brief This function initializes the class object
     # @param[in] key Key of the node
     # @param[in] value Value of the node
-    def __init__(self, key, value):
+    # @param[in] sort_key Key used for comparisons (computed once per node)
+    def __init__(self, key, value, sort_key):
         self.key = key
+        self.sort_key = sort_key
         self.value = value
         self.left = None
         self.right = None
@@ -12,46 +14,58 @@ class BstNode:
 # @brief This class manages provides an Dictionary ADT using BST
 class BstTree:
     # @brief This function initializes the class object
-    def __init__(self):
+    # @param[in] key Function mapping a key to the key used for comparisons
+    #            (None to compare the keys themselves)
+    def __init__(self, key=None):
         self.__root = None
+        self.__key = key
+
+    # @brief This function computes the key used for comparisons
+    # @param[in] key Key of the node or the key being searched for
+    # @retval Key used for comparisons
+    def __sort_key(self, key):
+        if self.__key is None:
+            return key
+        return self.__key(key)
 
     # @brief This function recursively inserts a key value pair in the tree
     # @param[in] root Node pointer or object
     # @param[in] key Key to be inserted
+    # @param[in] sort_key Key used for comparisons
     # @param[in] value Value to be inserted
     # @retval Node pointer or object
-    def __insert_recursive(self, root, key, value):
+    def __insert_recursive(self, root, key, sort_key, value):
         # Check if root is null
         if not root:
-            return BstNode(key, value)
+            return BstNode(key, value, sort_key)
         # If key is less than current key
-        elif key < root.key:
-            root.left = self.__insert_recursive(root.left, key, value)
+        elif sort_key < root.sort_key:
+            root.left = self.__insert_recursive(root.left, key, sort_key, value)
         # If key is greater than current key
         else:
-            root.right = self.__insert_recursive(root.right, key, value)
+            root.right = self.__insert_recursive(root.right, key, sort_key, value)
         return root
 
     # @brief The function available for the user to insert a key value pair
     # @param[in] key Key to be inserted
     # @param[in] value Value to be inserted
     def insert(self, key, value):
-        self.__root = self.__insert_recursive(self.__root, key, value)
+        self.__root = self.__insert_recursive(self.__root, key, self.__sort_key(key), value)
 
         # @brief This function recursively searches for a key in a tree
     # @param[in] root Node object or pointer
-    # @param[in] key Key to be searched formed
+    # @param[in] sort_key Key used for comparisons
     # @retval Returns the value corresponding to the key or None
-    def __search_recursive(self, root, key):
+    def __search_recursive(self, root, sort_key):
         # If root is None then return false
         if not root:
             return None
         # If key is less than current key
-        elif key < root.key:
-            return self.__search_recursive(root.left, key)
+        elif sort_key < root.sort_key:
+            return self.__search_recursive(root.left, sort_key)
         # If key is greater than current key
-        elif key > root.key:
-            return self.__search_recursive(root.right, key)
+        elif sort_key > root.sort_key:
+            return self.__search_recursive(root.right, sort_key)
         # If key found
         else:
             return root.value
@@ -59,5 +73,5 @@ class BstTree:
     # @brief The function available to the user to search for key's value
     # @param[in] key Key to be searched formed
     def search(self, key):
-        return self.__search_recursive(self.__root, key)
+        return self.__search_recursive(self.__root, self.__sort_key(key))
 
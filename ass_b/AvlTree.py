@@ -3,8 +3,10 @@ class AvlNode:
     # @brief This function initializes the class object
     # @param[in] key Key of the node
     # @param[in] value Value of the node
-    def __init__(self, key, value):
+    # @param[in] sort_key Key used for comparisons (computed once per node)
+    def __init__(self, key, value, sort_key):
         self.key = key
+        self.sort_key = sort_key
         self.value = [value]
         self.height = 1
         self.left = None
@@ -13,8 +15,19 @@ class AvlNode:
 # @brief This class manages provides an Dictionary ADT using AVL Trees
 class AvlTree:
     # @brief This function initializes the class object
-    def __init__(self):
+    # @param[in] key Function mapping a key to the key used for comparisons
+    #            (None to compare the keys themselves)
+    def __init__(self, key=None):
         self.__root = None
+        self.__key = key
+
+    # @brief This function computes the key used for comparisons
+    # @param[in] key Key of the node or the key being searched for
+    # @retval Key used for comparisons
+    def __sort_key(self, key):
+        if self.__key is None:
+            return key
+        return self.__key(key)
 
     # @brief Given a node object this function returns the height of that node
     # @param[in] node Node whose height is to be returned
@@ -70,18 +83,19 @@ class AvlTree:
     # @brief This function recursively inserts a key value pair in the tree
     # @param[in] root Node pointer or object
     # @param[in] key Key to be inserted
+    # @param[in] sort_key Key used for comparisons
     # @param[in] value Value to be inserted
     # @retval Node pointer or object
-    def __insert_recursive(self, root, key, value):
+    def __insert_recursive(self, root, key, sort_key, value):
         # Check if root is null
         if not root:
-            return AvlNode(key, value)
+            return AvlNode(key, value, sort_key)
         # If key is less than current key
-        elif key < root.key:
-            root.left = self.__insert_recursive(root.left, key, value)
+        elif sort_key < root.sort_key:
+            root.left = self.__insert_recursive(root.left, key, sort_key, value)
         # If key is greater than current key
         else:
-            root.right = self.__insert_recursive(root.right, key, value)
+            root.right = self.__insert_recursive(root.right, key, sort_key, value)
 
         # Calculate the balance factor of the current node
         balance_factor = self.get_height(root.left) - self.get_height(root.right)
@@ -89,7 +103,7 @@ class AvlTree:
         # If left heavy
         if balance_factor > 1:
             # Extra rotation for LR imbalance
-            if key > root.left.key:
+            if sort_key > root.left.sort_key:
                 root.left = self.__rotate_left(root.left, root.left.right)
             # Mandatory rotation for LR and LL imbalance
             root = self.__rotate_right(root, root.left)
@@ -97,7 +111,7 @@ class AvlTree:
         # If right heavy
         elif balance_factor < -1:
             # Extra rotation for RL imbalance
-            if key < root.right.key:
+            if sort_key < root.right.sort_key:
                 root.right = self.__rotate_right(root.right, root.right.left)
             # Mandatory rotation for RL and RR imbalance
             root = self.__rotate_left(root, root.right)
@@ -112,25 +126,25 @@ class AvlTree:
     # @param[in] key Key to be inserted
     # @param[in] value Value to be inserted
     def insert(self, key, value):
-        self.__root = self.__insert_recursive(self.__root, key, value)
+        self.__root = self.__insert_recursive(self.__root, key, self.__sort_key(key), value)
 
     # @brief The function recursively finds for a key and updates
     #        its values field by appending the specified value to its list
     # @param[in] root Node pointer or object
-    # @param[in] key Key to be searched for
+    # @param[in] sort_key Key used for comparisons
     # @param[in] value Value to be appended
     # @retval True If key found and updated
     # @retval False If key not found
-    def __find_and_update_recursive(self, root, key, value):
+    def __find_and_update_recursive(self, root, sort_key, value):
         # If root is None then return false
         if not root:
             return False
         # If key is less than current key
-        elif key < root.key:
-            return self.__find_and_update_recursive(root.left, key, value)
+        elif sort_key < root.sort_key:
+            return self.__find_and_update_recursive(root.left, sort_key, value)
         # If key is greater than current key
-        elif key > root.key:
-            return self.__find_and_update_recursive(root.right, key, value)
+        elif sort_key > root.sort_key:
+            return self.__find_and_update_recursive(root.right, sort_key, value)
         # If key found
         else:
             # Update the current node
@@ -142,7 +156,7 @@ class AvlTree:
     # @param[in] key Key to be searched for
     # @param[in] value Value to be appended
     def find_and_update(self, key, value):
-        return self.__find_and_update_recursive(self.__root, key, value)
+        return self.__find_and_update_recursive(self.__root, self.__sort_key(key), value)
 
     # @brief This function performs an inorder traversal of the tree
     #        printing the key value pair while traversing
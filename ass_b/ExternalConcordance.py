@@ -0,0 +1,186 @@
+import io
+import os
+import sys
+import heapq
+import shutil
+import tempfile
+
+# The resource module is not available on Windows
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Size of the buffer used for reading or writing a run file (the run files are
+# binary files so that no decoded text is buffered on top of it)
+RUN_BUFFER = io.DEFAULT_BUFFER_SIZE
+
+# @brief This class builds a word concordance using external memory. The key
+#        value pairs are buffered in memory and spilled to sorted run files on
+#        the local disk once the memory budget is reached. The runs are then
+#        merged, at most fan_in runs at a time, to produce the concordance in
+#        ascending order of the keys.
+class ExternalConcordance:
+    # @brief This function initializes the class object
+    # @param[in] budget Maximum number of bytes used by the buffered pairs
+    #            and the file buffers (at least a few RUN_BUFFER to be met)
+    # @param[in] directory Directory in which the run files are created
+    def __init__(self, budget, directory=None):
+        # The pairs share the budget with the buffer of the run being spilled
+        self.__budget = max(budget - RUN_BUFFER, RUN_BUFFER)
+        self.__buffer = []
+        self.__buffer_size = 0
+        self.__directory = tempfile.mkdtemp(prefix="concordance_", dir=directory)
+        self.__runs = []
+        self.__spilled = 0
+        self.__created = 0
+
+        # Merge as many runs at once as their read buffers fit in the budget
+        # next to the output (the batch of the result, its encoded and decoded
+        # copies and the buffer of the result file), keeping half of the open
+        # file limit (when the platform reports it)
+        self.__fan_in = budget // RUN_BUFFER - 4
+        if resource is not None:
+            limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+            if limit != resource.RLIM_INFINITY:
+                self.__fan_in = min(self.__fan_in, limit // 2)
+        self.__fan_in = max(self.__fan_in, 2)
+
+    # @brief This function returns the approximate memory used by a buffered
+    #        key value pair (the pair, the key, the value, the list slot with
+    #        its share of over allocation and the temporary space of the sort)
+    # @param[in] pair Key value pair
+    # @retval Integer number of bytes
+    def __pair_size(self, pair):
+        return sys.getsizeof(pair) + sys.getsizeof(pair[0]) + sys.getsizeof(pair[1]) + 16
+
+    # @brief This function writes key value pairs to a new run file
+    # @param[in] pairs Key value pairs in ascending order
+    def __write_run(self, pairs):
+        # Write the pairs to the run file one pair per line
+        run_name = os.path.join(self.__directory, "run_{}.txt".format(self.__created))
+        self.__created += 1
+        with open(run_name, "wb", buffering=RUN_BUFFER) as run_file:
+            for key, value in pairs:
+                run_file.write("{} {}\n".format(key, value).encode())
+        self.__runs.append(run_name)
+
+    # @brief This function sorts the buffered pairs and writes them to a new
+    #        run file
+    def __spill(self):
+        # Sort the pairs by the key and then by the value
+        self.__buffer.sort()
+        self.__write_run(self.__buffer)
+        self.__spilled += 1
+
+        # Empty the buffer
+        self.__buffer = []
+        self.__buffer_size = 0
+
+    # @brief The function available for the user to add a key value pair
+    # @param[in] key Key to be added
+    # @param[in] value Value to be added
+    def add(self, key, value):
+        pair = (key, value)
+        self.__buffer.append(pair)
+        self.__buffer_size += self.__pair_size(pair)
+
+        # Spill the buffer to the disk if the budget is reached
+        if self.__buffer_size >= self.__budget:
+            self.__spill()
+
+    # @brief This function reads the key value pairs from a run file
+    # @param[in] run_file File pointer to the run file
+    # @retval Generator of key value pairs in ascending order
+    def __read_run(self, run_file):
+        for line in run_file:
+            key, value = line.split()
+            yield key.decode(), int(value)
+
+    # @brief The function available for the user to get the number of run
+    #        files spilled to the disk (complete after finish is called)
+    # @retval Integer number of runs
+    def run_count(self):
+        return self.__spilled
+
+    # @brief The function available for the user to end adding pairs. If runs
+    #        were spilled then the rest of the pairs are spilled as well so that
+    #        only the read buffers of the runs are in memory while merging
+    def finish(self):
+        if self.__runs and self.__buffer:
+            self.__spill()
+
+    # @brief This function merges the oldest fan_in runs into a new run and
+    #        removes the merged runs
+    def __merge_runs(self):
+        run_names = self.__runs[:self.__fan_in]
+        self.__runs = self.__runs[self.__fan_in:]
+
+        run_files = [open(run_name, "rb", buffering=RUN_BUFFER) for run_name in run_names]
+        try:
+            self.__write_run(heapq.merge(*[self.__read_run(each) for each in run_files]))
+        finally:
+            for each in run_files:
+                each.close()
+
+        for run_name in run_names:
+            os.remove(run_name)
+
+    # @brief The function available for the user to print the concordance in
+    #        ascending order by merging the run files and the buffered pairs
+    # @param[in] fp File pointer to the result file
+    def print_concordance(self, fp):
+        # Spill the rest of the pairs if not done already
+        self.finish()
+
+        # Sort the pairs that are still in memory
+        self.__buffer.sort()
+
+        # Merge the runs in passes till at most fan_in runs remain
+        while len(self.__runs) > self.__fan_in:
+            self.__merge_runs()
+
+        run_files = [open(run_name, "rb", buffering=RUN_BUFFER) for run_name in self.__runs]
+        try:
+            # Merge the runs and the buffer (equal pairs are identical so the
+            # order of the merged runs does not matter)
+            pairs = heapq.merge(*[self.__read_run(each) for each in run_files], self.__buffer)
+
+            # The result is collected in a batch of RUN_BUFFER bytes which is
+            # written at once, many small writes make the file buffer larger
+            batch = bytearray()
+            current_key = None
+            for key, value in pairs:
+                # Begin a new line of the result for a new key
+                if key != current_key:
+                    if current_key is not None:
+                        batch += b"\n"
+                    batch += "{}: ".format(key).encode()
+                    current_key = key
+                batch += "{} ".format(value).encode()
+                if len(batch) >= RUN_BUFFER:
+                    fp.write(batch.decode())
+                    batch = bytearray()
+            if current_key is not None:
+                batch += b"\n"
+            fp.write(batch.decode())
+        finally:
+            for each in run_files:
+                each.close()
+
+    # @brief This function allows the object to be used in a with statement
+    # @retval The class object
+    def __enter__(self):
+        return self
+
+    # @brief This function removes the run files when the with statement
+    #        exits, also if an exception was raised
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # @brief The function available for the user to remove the run files
+    def close(self):
+        shutil.rmtree(self.__directory, ignore_errors=True)
+        self.__runs = []
+        self.__buffer = []
+        self.__buffer_size = 0
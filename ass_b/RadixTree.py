@@ -0,0 +1,205 @@
+# @brief This class holds the fields required for a single node in Radix Tree
+class RadixNode:
+    # @brief This function initializes the class object
+    # @param[in] label Part of the key stored on the edge leading to the node
+    def __init__(self, label):
+        self.label = label
+        # A key ends at the node only if is_key is set (values may be None)
+        self.is_key = False
+        self.value = None
+        self.children = {}
+        # Original key, stored only when the tree has a key function
+        self.key = None
+
+# @brief This class manages provides an Dictionary ADT using a compressed
+#        Radix Tree (Patricia Trie) for string keys
+class RadixTree:
+    # @brief This function initializes the class object
+    # @param[in] key Function mapping a key to the string stored along the
+    #            edges of the tree (None to store the keys themselves)
+    def __init__(self, key=None):
+        self.__root = RadixNode("")
+        self.__key = key
+
+    # @brief This function computes the string stored along the edges
+    # @param[in] key Key being inserted or searched for
+    # @retval String used for the edges
+    def __sort_key(self, key):
+        if self.__key is None:
+            return key
+        return self.__key(key)
+
+    # @brief This function returns the length of the common prefix of the
+    #        label and the key starting at the given position
+    # @param[in] label Label of the node
+    # @param[in] key Key being processed
+    # @param[in] pos Position in the key from where the label is compared
+    # @retval Integer length of the common prefix
+    def __common_prefix(self, label, key, pos):
+        length = 0
+        while length < len(label) and pos + length < len(key) \
+              and label[length] == key[pos + length]:
+            length += 1
+        return length
+
+    # @brief This function recursively inserts a key value pair in the tree
+    # @param[in] root Node pointer or object
+    # @param[in] key Key used for the edges
+    # @param[in] pos Position in the key matched till the current node
+    # @param[in] value Value to be inserted
+    # @param[in] original Key to be inserted (None if same as key)
+    def __insert_recursive(self, root, key, pos, value, original):
+        # If the complete key is matched then store the value at this node
+        if pos == len(key):
+            if not root.is_key:
+                root.is_key = True
+                root.value = [value]
+                root.key = original
+            else:
+                root.value.append(value)
+            return
+
+        # Find the child whose label begins with the next character
+        child = root.children.get(key[pos])
+
+        # If there is no such child then the rest of the key is a new leaf
+        if not child:
+            child = RadixNode(key[pos:])
+            root.children[key[pos]] = child
+            self.__insert_recursive(child, key, len(key), value, original)
+            return
+
+        # Find the length of the label matched by the key
+        length = self.__common_prefix(child.label, key, pos)
+
+        # If the label is matched partially then split the edge so that the
+        # common prefix is stored only once
+        if length < len(child.label):
+            middle = RadixNode(child.label[:length])
+            child.label = child.label[length:]
+            middle.children[child.label[0]] = child
+            root.children[key[pos]] = middle
+            child = middle
+
+        # Go down the matched edge
+        self.__insert_recursive(child, key, pos + length, value, original)
+
+    # @brief The function available for the user to insert a key value pair
+    # @param[in] key Key to be inserted
+    # @param[in] value Value to be inserted
+    def insert(self, key, value):
+        if self.__key is None:
+            self.__insert_recursive(self.__root, key, 0, value, None)
+        else:
+            self.__insert_recursive(self.__root, self.__key(key), 0, value, key)
+
+    # @brief This function recursively finds the node at which a key ends
+    # @param[in] root Node pointer or object
+    # @param[in] key Key to be searched for
+    # @param[in] pos Position in the key matched till the current node
+    # @retval Node pointer or object if key found else None
+    def __find_recursive(self, root, key, pos):
+        # If the complete key is matched then the key is present only if it
+        # ends at this node
+        if pos == len(key):
+            return root if root.is_key else None
+
+        # Find the child whose label begins with the next character
+        child = root.children.get(key[pos])
+
+        # If there is no such child or its label is not matched completely
+        if not child or not key.startswith(child.label, pos):
+            return None
+
+        # Go down the matched edge
+        return self.__find_recursive(child, key, pos + len(child.label))
+
+    # @brief The function available for the user to update a key's value
+    #        by appending the specified value to its list
+    # @param[in] key Key to be searched for
+    # @param[in] value Value to be appended
+    # @retval True If key found and updated
+    # @retval False If key not found
+    def find_and_update(self, key, value):
+        node = self.__find_recursive(self.__root, self.__sort_key(key), 0)
+        if not node:
+            return False
+        node.value.append(value)
+        return True
+
+    # @brief The function available to the user to search for key's value
+    # @param[in] key Key to be searched for
+    # @retval Returns the value corresponding to the key or None
+    def search(self, key):
+        node = self.__find_recursive(self.__root, self.__sort_key(key), 0)
+        if not node:
+            return None
+        return node.value
+
+    # @brief This function performs a preorder traversal of the tree in the
+    #        ascending order of the labels collecting the key value pairs
+    # @param[in] root Node object or pointer
+    # @param[in] prefix Key formed by the labels till the current node
+    # @param[in] result List to which the key value pairs are appended
+    def __collect_recursive(self, root, prefix, result):
+        # Collect the current key and values
+        if root.is_key:
+            result.append((prefix if root.key is None else root.key, root.value))
+
+        # Go to the children in the ascending order
+        for first in sorted(root.children):
+            child = root.children[first]
+            self.__collect_recursive(child, prefix + child.label, result)
+
+    # @brief The function available to the user to find all the keys
+    #        beginning with a prefix
+    # @param[in] prefix Prefix to be searched for
+    # @retval List of key value pairs in the ascending order of the keys
+    def prefix_search(self, prefix):
+        prefix = self.__sort_key(prefix)
+        result = []
+        root = self.__root
+        key = ""
+        pos = 0
+
+        # Go down the edges matched by the prefix
+        while pos < len(prefix):
+            child = root.children.get(prefix[pos])
+            if not child:
+                return result
+            length = self.__common_prefix(child.label, prefix, pos)
+            # The prefix may end in between the label of the child
+            if length < len(child.label) and pos + length < len(prefix):
+                return result
+            key += child.label
+            pos += length
+            root = child
+
+        # Collect every key below the node where the prefix ends
+        self.__collect_recursive(root, key, result)
+        return result
+
+    # @brief This function performs a preorder traversal of the tree in the
+    #        ascending order of the labels printing the key value pair while
+    #        traversing
+    # @param[in] root Node object or pointer
+    # @param[in] prefix Key formed by the labels till the current node
+    # @param[in] fp File pointer to the result file
+    def __print_recursive(self, root, prefix, fp):
+        # Write the current key and values to the file
+        if root.is_key:
+            fp.write("{}: ".format(prefix if root.key is None else root.key))
+            for line_no in root.value:
+                fp.write("{} ".format(line_no))
+            fp.write("\n")
+
+        # Go to the children in the ascending order
+        for first in sorted(root.children):
+            child = root.children[first]
+            self.__print_recursive(child, prefix + child.label, fp)
+
+    # @brief The function available for the user to print the tree in
+    #        ascending order
+    # @param[in] fp File pointer to the result file
+    def print_tree(self, fp):
+        self.__print_recursive(self.__root, "", fp)
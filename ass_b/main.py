@@ -1,8 +1,262 @@
+import io
+import os
 import re
 import sys
 import time
+import json
+import cProfile
+import tempfile
+import subprocess
+import tracemalloc
+
+# The resource module is not available on Windows
+try:
+    import resource
+except ImportError:
+    resource = None
+
 from BstTree import BstTree
 from AvlTree import AvlTree
+from RadixTree import RadixTree
+from ExternalConcordance import ExternalConcordance
+
+# Check for the type of the tree and the optional profiling flags
+if len(sys.argv) < 2:
+    print("** Program usage: python3 main.py AVL/BST/RADIX/EXTERNAL [--profile] [--cprofile <file>] [--budget <bytes>] [--casefold]")
+    sys.exit()
+
+if sys.argv[1] not in ("AVL", "BST", "RADIX", "EXTERNAL"):
+    print("** Invalid argument: AVL, BST, RADIX or EXTERNAL are the only valid arguments")
+    sys.exit()
+
+# Parse the optional profiling flags and the memory budget of the external build
+profile = False
+cprofile_file = None
+trace_file = None
+budget = 64 * 1024 * 1024
+casefold = False
+args = sys.argv[2:]
+while args:
+    if args[0] == "--profile":
+        profile = True
+        args = args[1:]
+    elif args[0] == "--cprofile" and len(args) > 1:
+        cprofile_file = args[1]
+        args = args[2:]
+    elif args[0] == "--budget" and len(args) > 1 and args[1].isdigit():
+        budget = int(args[1])
+        args = args[2:]
+    elif args[0] == "--casefold":
+        casefold = True
+        args = args[1:]
+    # Internal flag used by the profile mode for the memory tracing run
+    elif args[0] == "--trace-memory" and len(args) > 1:
+        trace_file = args[1]
+        args = args[2:]
+    else:
+        print("** Invalid argument: {}".format(args[0]))
+        sys.exit()
+
+# The external build compares the words as they are written to the run files
+if casefold and sys.argv[1] == "EXTERNAL":
+    print("** Invalid argument: --casefold is not supported by EXTERNAL")
+    sys.exit()
+
+# Without case folding the text is lowercased once before processing, with
+# case folding the original text is kept and the trees compare the casefolded
+# words (stop words and letters are then matched ignoring the case)
+key = str.casefold if casefold else None
+flags = re.IGNORECASE if casefold else 0
+letters = r"[a-zA-Z]+" if casefold else r"[a-z]+"
+
+# Per phase statistics (time in secs, memory in bytes) for the profile mode.
+# The times are taken without tracing the memory, the memory is traced in a
+# separate run of the program so that tracemalloc does not skew the times.
+phases = {}
+phase_start = 0
+phase_memory = 0
+
+# @brief This function marks the beginning of a profiled phase
+def begin_phase():
+    global phase_start, phase_memory
+    if trace_file:
+        tracemalloc.reset_peak()
+        phase_memory = tracemalloc.get_traced_memory()[0]
+    phase_start = time.perf_counter()
+
+# @brief This function records the time or the memory used by a profiled phase
+# @param[in] name Name of the phase
+def end_phase(name):
+    elapsed = time.perf_counter() - phase_start
+    if trace_file:
+        current, peak = tracemalloc.get_traced_memory()
+        phases[name] = {"start_memory": phase_memory, "current_memory": current, "peak_memory": peak}
+    else:
+        phases[name] = {"time": elapsed}
+
+# @brief This function returns the peak resident set size of the program
+# @retval Integer number of bytes (None if not available on the platform)
+def peak_rss():
+    if resource is None:
+        return None
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    if sys.platform == "darwin":
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+# @brief This function runs the program again with memory tracing and adds
+#        the memory used by each phase to the timed phases
+def trace_memory():
+    trace_args = [sys.executable, sys.argv[0], sys.argv[1], "--budget", str(budget)]
+    if casefold:
+        trace_args.append("--casefold")
+
+    with tempfile.TemporaryDirectory() as directory:
+        trace_name = os.path.join(directory, "memory.json")
+        subprocess.run(trace_args + ["--trace-memory", trace_name],
+                       stdout=subprocess.DEVNULL, check=True)
+        with open(trace_name, "r") as memory_file:
+            memory = json.load(memory_file)
+
+    for name in memory:
+        phases[name].update(memory[name])
+
+# @brief This function writes the memory used by each phase in the memory
+#        tracing run
+def write_trace():
+    tracemalloc.stop()
+    with open(trace_file, "w") as memory_file:
+        json.dump(phases, memory_file)
+
+# Start tracing the memory allocations in the memory tracing run
+if trace_file:
+    tracemalloc.start()
+
+# @brief This function removes the stop words from a chunk of lines and
+#        adds the remaining words of each line to the external concordance
+# @param[in] chunk List of lines read from the data file
+# @param[in] line_number Line number of the first line of the chunk
+# @retval Integer line number of the line after the chunk
+def process_chunk(chunk, line_number):
+    global postings, add_time
+    chunk_lines = "".join(chunk).lower()
+
+    for pattern in stop_patterns:
+        chunk_lines = pattern.sub("", chunk_lines)
+
+    # Extract the words of each line (dropping the empty string after the
+    # newline ending the last line)
+    chunk_lines = [re.findall(r"[a-z]+", each) for each in chunk_lines.split('\n')[:len(chunk)]]
+
+    # Time adding the words separately from the preprocessing so that the
+    # tokens per second compare with the insertion in the trees
+    start_time = time.perf_counter()
+    for line in chunk_lines:
+        for word in line:
+            concordance.add(word, line_number)
+            postings += 1
+        line_number += 1
+    add_time += time.perf_counter() - start_time
+
+    return line_number
+
+# Build the concordance using external memory without holding the complete
+# text or a tree in memory
+if sys.argv[1] == "EXTERNAL":
+    # Debug printing
+    print("Beginning external build (MEMORY BUDGET {} bytes)...".format(budget))
+
+    # Read the stop words and compile their patterns once
+    stop = open("stop_words.txt", "r")
+    stop_patterns = [re.compile(r"\b{}\b".format(each.strip().lower())) for each in stop]
+    stop.close()
+
+    # Split the budget between the text of a chunk and the buffered pairs.
+    # The data file is read through a binary buffer and a decoded text buffer.
+    # While a chunk is processed its lines, the joined text, the copy made by
+    # a substitution and the split lines are in memory at once, so four times
+    # the chunk and the buffers of the data file get half of the budget and
+    # the pairs get the other half
+    reader_size = 2 * io.DEFAULT_BUFFER_SIZE
+    chunk_budget = max((budget // 2 - reader_size) // 4, 1)
+
+    # The run files are removed even if the build or the merge fails
+    with ExternalConcordance(budget - reader_size - 4 * chunk_budget) as concordance:
+        line_number = 0
+        postings = 0
+        add_time = 0
+
+        begin_phase()
+
+        # Read the data file in chunks of lines (sized in bytes of memory)
+        with open("data.txt", "r") as data:
+            chunk = []
+            chunk_size = 0
+            for line in data:
+                chunk.append(line)
+                chunk_size += sys.getsizeof(line)
+                if chunk_size >= chunk_budget:
+                    line_number = process_chunk(chunk, line_number)
+                    chunk = []
+                    chunk_size = 0
+            line_number = process_chunk(chunk, line_number)
+
+        # Spill the last pairs before counting the runs
+        concordance.finish()
+
+        end_phase("build")
+
+        # Debug printing
+        runs = concordance.run_count()
+        print("Finished external build ({} runs spilled to the disk).".format(runs))
+
+        begin_phase()
+
+        # Merge the runs and write the result in the file
+        result_name = "external_result.txt"
+        with open(result_name, "w") as result_file:
+            concordance.print_concordance(result_file)
+
+        end_phase("merge")
+
+    # Debug printing
+    print("Result written to the file <{}>.".format(result_name))
+
+    # Write the per phase memory in the memory tracing run
+    if trace_file:
+        write_trace()
+
+    # Write the per phase breakdown in the profile mode
+    elif profile:
+        trace_memory()
+
+        # The budget covers only the memory growing with the corpus, the
+        # memory in use before the build (mainly the compiled stop word
+        # patterns) is a fixed baseline outside of the budget
+        baseline_memory = phases["build"]["start_memory"]
+        budget_memory = max(phases["build"]["peak_memory"], phases["merge"]["peak_memory"]) - baseline_memory
+
+        report = {
+            "tree": sys.argv[1],
+            "budget": budget,
+            "baseline_memory": baseline_memory,
+            "peak_memory_above_baseline": budget_memory,
+            "phases": phases,
+            "postings": postings,
+            "runs": runs,
+            "add_time": add_time,
+            "tokens_per_sec": postings / add_time if add_time else 0,
+            "peak_rss": peak_rss(),
+        }
+
+        profile_name = "external_profile.json"
+        with open(profile_name, "w") as profile_file:
+            json.dump(report, profile_file, indent=4)
+
+        # Debug printing
+        print("Profile written to the file <{}>.".format(profile_name))
+
+    sys.exit()
 
 # Debug printing
 print("Processing the input files...")
@@ -12,46 +266,62 @@ data = open("data.txt", "r")
 # Open the stop words file
 stop = open("stop_words.txt", "r")
 
+begin_phase()
+
 # Read the data file
-data_lines = data.read().lower()
+data_lines = data.read()
+if not casefold:
+    data_lines = data_lines.lower()
 
 # Read the stop words
 stop_words = stop.readlines()
 # Remove newline from each word (list of words)
 stop_words = [each.strip().lower() for each in stop_words]
 
+end_phase("read")
+begin_phase()
+
 for word in stop_words:
-    data_lines = re.sub(r"\b{}\b".format(word), "", data_lines)
+    data_lines = re.sub(r"\b{}\b".format(word), "", data_lines, flags=flags)
+
+end_phase("stop_words")
+begin_phase()
 
 # Convert the string file in list of lines where each line is a string
 data_lines = data_lines.split('\n')
 
 # Extract only letter words from each line delimited by a non letter character
-data_lines = [re.findall(r"[a-z]+", each) for each in data_lines]
+data_lines = [re.findall(letters, each) for each in data_lines]
+
+end_phase("tokenize")
 
 # Debug printing
 print("Processed the input files.")
 
-# Check for the type of the tree
-if len(sys.argv) != 2:
-    print("** Program usage: python3 main.py AVL/BST")
-    sys.exit()
-
 if sys.argv[1] == "AVL":
-    tree = AvlTree()
+    tree = AvlTree(key=key)
 elif sys.argv[1] == "BST":
-    tree = BstTree()
+    tree = BstTree(key=key)
 else:
-    print("** Invalid argument: AVL or BST are the only valid arguments")
-    sys.exit()
+    tree = RadixTree(key=key)
 
 # Set current line number to zero
 line_number = 0
 
+# Number of words inserted as new nodes and number of line numbers stored
+nodes = 0
+postings = 0
+
 # Debug printing
 print("Beginning insertion in the {} tree...".format(sys.argv[1]))
 
+# Profile the insertion loop with cProfile if requested
+if cprofile_file and not trace_file:
+    profiler = cProfile.Profile()
+    profiler.enable()
+
 # Get the time before execution
+begin_phase()
 start_time = time.time()
 
 # For each line insert its words in the tree
@@ -61,10 +331,17 @@ for line in data_lines:
         # Find and update, if found then continue else insert new word
         if not tree.find_and_update(word, line_number):
             tree.insert(word, line_number)
+            nodes += 1
+        postings += 1
     line_number += 1
 
 # Get the time after execution
 end_time = time.time()
+end_phase("insert")
+
+if cprofile_file and not trace_file:
+    profiler.disable()
+    profiler.dump_stats(cprofile_file)
 
 # Debug printing
 print("Finished insertion in the {} tree (TIME TAKEN {} secs).".format(sys.argv[1], end_time - start_time))
@@ -73,11 +350,11 @@ print("Finished insertion in the {} tree (TIME TAKEN {} secs).".format(sys.argv[
 # Debug printing
 print("Writing the result to the text file...")
 
+begin_phase()
+
 # Write the result in the file
-if sys.argv[1] == "AVL":
-    result_file = open("avl_result.txt", "w")
-else:
-    result_file = open("bst_result.txt", "w")
+result_name = "{}_result.txt".format(sys.argv[1].lower())
+result_file = open(result_name, "w")
 
 # Print the tree
 tree.print_tree(result_file)
@@ -87,8 +364,40 @@ data.close()
 stop.close()
 result_file.close()
 
+end_phase("output")
+
 # Debug printing
-if sys.argv[1] == "AVL":
-    print("Result written to the file <avl_result.txt>.")
-else:
-    print("Result written to the file <bst_result.txt>.")
+print("Result written to the file <{}>.".format(result_name))
+
+# Write the per phase memory in the memory tracing run
+if trace_file:
+    write_trace()
+
+# Write the per phase breakdown in the profile mode
+elif profile:
+    trace_memory()
+
+    # The memory retained by the insertion phase is the memory of the tree.
+    # The per node and per posting figures are both averages of this total
+    # (nodes and posting lists together), not a split of it
+    tree_memory = phases["insert"]["current_memory"] - phases["tokenize"]["current_memory"]
+    insert_time = phases["insert"]["time"]
+
+    report = {
+        "tree": sys.argv[1],
+        "phases": phases,
+        "nodes": nodes,
+        "postings": postings,
+        "tree_memory": tree_memory,
+        "tree_memory_per_node": tree_memory / nodes if nodes else 0,
+        "tree_memory_per_posting": tree_memory / postings if postings else 0,
+        "tokens_per_sec": postings / insert_time if insert_time else 0,
+        "peak_rss": peak_rss(),
+    }
+
+    profile_name = "{}_profile.json".format(sys.argv[1].lower())
+    with open(profile_name, "w") as profile_file:
+        json.dump(report, profile_file, indent=4)
+
+    # Debug printing
+    print("Profile written to the file <{}>.".format(profile_name))
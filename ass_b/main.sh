@@ -8,3 +8,7 @@ python3 ./main.py BST
 echo "_____________AVL_IMPLEMENTATION_______________"
 # Execute the program for the AVL implementation
 python3 ./main.py AVL
+
+echo "_____________RADIX_IMPLEMENTATION_____________"
+# Execute the program for the Radix Tree implementation
+python3 ./main.py RADIX